@@ -1,5 +1,6 @@
 """Configuration management for the forecasting research CLI tool."""
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -8,6 +9,12 @@ import yaml
 from dotenv import load_dotenv
 import os
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
 
 @dataclass
 class SearchConfig:
@@ -37,10 +44,22 @@ class ConfigError(Exception):
     pass
 
 
+# Module-level cache of parsed configs: resolved path -> (mtime, size, Config)
+_CONFIG_CACHE: OrderedDict[str, tuple[float, int, Config]] = OrderedDict()
+_CONFIG_CACHE_MAX_SIZE = 100
+
+# Whether the .env file has already been loaded into the environment
+_DOTENV_LOADED = False
+
+
 def load_config(config_path: Path | str | None = None) -> Config:
     """
     Load and validate application configuration.
     
+    Parsed configs are cached per file and reused until the file's
+    mtime or size changes. The cached Config instance is shared between
+    callers, so it should be treated as read-only.
+    
     Args:
         config_path: Path to the YAML config file. Defaults to config.yaml
                      in the same directory as this module.
@@ -51,8 +70,12 @@ def load_config(config_path: Path | str | None = None) -> Config:
     Raises:
         ConfigError: If the API key is missing or config file is invalid.
     """
-    # Load environment variables from .env file
-    load_dotenv()
+    global _DOTENV_LOADED
+    
+    # Load environment variables from .env file (once per process)
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
     
     # Validate API key exists
     api_key = os.getenv("OPENROUTER_API_KEY")
@@ -69,12 +92,23 @@ def load_config(config_path: Path | str | None = None) -> Config:
         config_path = Path(config_path)
     
     # Load YAML configuration
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
         raise ConfigError(f"Configuration file not found: {config_path}")
     
+    # Return the cached config if the file is unchanged
+    cache_key = str(config_path.resolve())
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        mtime, size, cached_config = cached
+        if mtime == st.st_mtime and size == st.st_size and cached_config.api_key == api_key:
+            _CONFIG_CACHE.move_to_end(cache_key)
+            return cached_config
+    
     try:
         with open(config_path, "r") as f:
-            raw_config: dict[str, Any] = yaml.safe_load(f)
+            raw_config: dict[str, Any] = yaml.load(f, Loader=_Loader)
     except yaml.YAMLError as e:
         raise ConfigError(f"Invalid YAML in config file: {e}") from e
     
@@ -91,23 +125,31 @@ def load_config(config_path: Path | str | None = None) -> Config:
         tier_2=tiers_data.get("tier_2", []),
     )
     
-    return Config(
+    config = Config(
         model_id=raw_config.get("model_id", ""),
         api_key=api_key,
         search=search_config,
         domain_tiers=domain_tiers,
     )
+    
+    # Cache the result, evicting the least recently used entry if full
+    _CONFIG_CACHE[cache_key] = (st.st_mtime, st.st_size, config)
+    _CONFIG_CACHE.move_to_end(cache_key)
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX_SIZE:
+        _CONFIG_CACHE.popitem(last=False)
+    
+    return config
 
 
-# Useless function?
-def get_config() -> Config:
-    """
-    Convenience function to load the default configuration.
-    
-    Returns:
-        A validated Config object using default paths.
-    """
-    return load_config()
+def clear_config_cache() -> None:
+    """Clear the parsed configuration cache."""
+    _CONFIG_CACHE.clear()
+
+
+def _reset_dotenv_cache() -> None:
+    """Force the next load_config call to re-read the .env file."""
+    global _DOTENV_LOADED
+    _DOTENV_LOADED = False
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 """Forecasting logic for research planning and source classification."""
 
+import asyncio
+import functools
 import json
 import re
 from typing import TypedDict
@@ -7,7 +9,7 @@ from urllib.parse import urlparse
 
 from config import Config, load_config
 from llm_client import LLMClient, LLMClientError
-from search_engine import perform_search
+from search_engine import close_ddgs, perform_search
 
 
 class SearchPlan(TypedDict):
@@ -20,6 +22,9 @@ class SearchPlan(TypedDict):
 # Module-level cache for domain tier classifications
 _domain_tier_cache: dict[str, int] = {}
 
+# In-flight LLM classifications, shared by concurrent lookups of the same domain
+_domain_tier_pending: dict[str, asyncio.Task[int]] = {}
+
 
 async def generate_search_plan(
     client: LLMClient,
@@ -90,6 +95,7 @@ Return ONLY the JSON object, no other text."""
         )
 
 
+@functools.lru_cache(maxsize=1024)
 def _extract_domain(url: str) -> str:
     """Extract the base domain from a URL."""
     parsed = urlparse(url)
@@ -156,7 +162,34 @@ async def classify_source(
         _domain_tier_cache[domain] = config_tier
         return config_tier
     
-    # Fall back to LLM classification
+    # Fall back to LLM classification, sharing any in-flight call for this domain
+    task = _domain_tier_pending.get(domain)
+    if task is None:
+        task = asyncio.create_task(_classify_domain_with_llm(domain, client))
+        _domain_tier_pending[domain] = task
+        task.add_done_callback(lambda t: _forget_pending(domain, t))
+    
+    # Shield the shared task so cancelling one caller does not cancel the rest
+    tier = await asyncio.shield(task)
+    
+    # Cache the result
+    _domain_tier_cache[domain] = tier
+    return tier
+
+
+def _forget_pending(domain: str, task: asyncio.Task[int]) -> None:
+    """Drop a finished classification task from the in-flight map."""
+    if _domain_tier_pending.get(domain) is task:
+        del _domain_tier_pending[domain]
+
+
+async def _classify_domain_with_llm(domain: str, client: LLMClient) -> int:
+    """
+    Ask the LLM to classify a domain into a credibility tier.
+    
+    Returns the tier (1-5), defaulting to 4 if the response is unclear
+    or the call fails.
+    """
     prompt = f"""Classify the domain "{domain}" into a credibility tier for research purposes.
 
 Tier 1: Academic/peer-reviewed sources (journals, .edu, arxiv)
@@ -175,21 +208,17 @@ Return ONLY a single number from 1 to 5."""
         # Extract the number from response
         numbers = re.findall(r"\b([1-5])\b", response)
         if numbers:
-            tier = int(numbers[0])
-        else:
-            tier = 4  # Default to lower credibility if unclear
+            return int(numbers[0])
+        return 4  # Default to lower credibility if unclear
             
     except LLMClientError:
-        tier = 4  # Default on error
-    
-    # Cache the result
-    _domain_tier_cache[domain] = tier
-    return tier
+        return 4  # Default on error
 
 
 def clear_tier_cache() -> None:
     """Clear the domain tier cache."""
     _domain_tier_cache.clear()
+    _domain_tier_pending.clear()
 
 
 async def analyze_base_rates(
@@ -309,8 +338,9 @@ async def main() -> None:
         print(f"\nBase Rate Summary:\n{base_rate_summary}")
     else:
         print("No historical queries to analyze.")
+    
+    await close_ddgs()
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
@@ -1,6 +1,7 @@
 """LLM client for interacting with OpenRouter API."""
 
 import asyncio
+from collections.abc import AsyncIterator
 from typing import Any
 
 from openai import AsyncOpenAI
@@ -67,6 +68,46 @@ class LLMClient:
             
         except Exception as e:
             raise LLMClientError(f"LLM API call failed: {e}") from e
+    
+    async def stream_response(
+        self,
+        messages: list[dict[str, str]],
+        model: str | None = None,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response from the LLM as it is generated.
+        
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys.
+            model: Model identifier. Defaults to config.model_id if not provided.
+            temperature: Sampling temperature (0.0 to 1.0). Defaults to 0.7.
+        
+        Yields:
+            Pieces of the response content in the order they arrive.
+        
+        Raises:
+            LLMClientError: If the API call fails or the stream is interrupted.
+        """
+        model = model or self.config.model_id
+        
+        try:
+            stream = await self.client.chat.completions.create(
+                model=model,
+                messages=messages,  # type: ignore[arg-type]
+                temperature=temperature,
+                stream=True,
+            )
+            
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if content:
+                    yield content
+                    
+        except Exception as e:
+            raise LLMClientError(f"LLM API call failed: {e}") from e
 
 
 async def main() -> None:
@@ -19,8 +19,12 @@ from forecasting_logic import (
     analyze_base_rates,
     SearchPlan,
 )
-from search_engine import gather_data
-from writer import write_brief, save_brief, PlanInfo, SourceInfo
+from search_engine import close_ddgs, gather_data
+from writer import write_brief, save_brief, build_source_info, PlanInfo, SourceInfo
+
+
+# Max concurrent LLM calls when classifying source tiers
+CLASSIFY_CONCURRENCY = 8
 
 
 def parse_args() -> argparse.Namespace:
@@ -100,51 +104,65 @@ async def main() -> None:
     print(f"  ✓ Search queries: {len(plan['search_queries'])}")
     print(f"  ✓ Historical queries: {len(plan['historical_queries'])}")
     
-    # Step C: Gather data (search + scrape)
+    # Steps C and D are independent, so gather data (search + scrape)
+    # and analyze base rates at the same time
     print("[Step 3/7] Searching and scraping sources...")
-    scraped_data = await gather_data(
-        queries=plan["search_queries"],
-        max_results_per_query=5,
-        max_urls=config.search.max_queries,
-        scrape_concurrency=3,
-        scrape_timeout=config.search.scrape_timeout,
+    print("[Step 4/7] Analyzing base rates from historical data...")
+    scrape_task = asyncio.create_task(
+        gather_data(
+            queries=plan["search_queries"],
+            max_results_per_query=5,
+            max_urls=config.search.max_queries,
+            scrape_concurrency=3,
+            scrape_timeout=config.search.scrape_timeout,
+        )
     )
+    base_rate_task = asyncio.create_task(
+        analyze_base_rates(
+            client=client,
+            question=args.question,
+            historical_queries=plan["historical_queries"],
+            max_results_per_query=5,
+        )
+    )
+    try:
+        scraped_data, base_rate_summary = await asyncio.gather(
+            scrape_task, base_rate_task
+        )
+    finally:
+        # Stop whichever task is still running if the other one failed
+        scrape_task.cancel()
+        base_rate_task.cancel()
+        await close_ddgs()
     
-    successful_scrapes = [s for s in scraped_data if s["status"] == "success"]
+    successful_scrapes = [s for s in scraped_data if s.status == "success"]
     print(f"  ✓ Scraped {len(successful_scrapes)}/{len(scraped_data)} sources successfully")
-    
-    # Step D: Analyze base rates (runs concurrently conceptually, but after scraping)
-    print("[Step 4/7] Analyzing base rates from historical data...")
-    base_rate_summary = await analyze_base_rates(
-        client=client,
-        question=args.question,
-        historical_queries=plan["historical_queries"],
-        max_results_per_query=5,
-    )
     print(f"  ✓ Base rate analysis complete")
     
     # Step E: Classify source tiers
     print("[Step 5/7] Classifying source credibility tiers...")
-    sources_with_tiers: list[SourceInfo] = []
-    
-    for scrape in scraped_data:
-        tier = await classify_source(
-            domain_or_url=scrape["url"],
-            client=client,
-            config=config,
-        )
-        sources_with_tiers.append(
-            SourceInfo(
-                url=scrape["url"],
-                text=scrape["text"],
-                tier=tier,
-                status=scrape["status"],
+    classify_semaphore = asyncio.Semaphore(CLASSIFY_CONCURRENCY)
+    
+    async def classify_with_limit(url: str) -> int:
+        async with classify_semaphore:
+            return await classify_source(
+                domain_or_url=url,
+                client=client,
+                config=config,
             )
-        )
+    
+    tiers = await asyncio.gather(
+        *(classify_with_limit(scrape.url) for scrape in scraped_data)
+    )
+    
+    sources_with_tiers: list[SourceInfo] = [
+        build_source_info(scrape, tier)
+        for scrape, tier in zip(scraped_data, tiers)
+    ]
     
     tier_counts = {}
     for s in sources_with_tiers:
-        tier_counts[s["tier"]] = tier_counts.get(s["tier"], 0) + 1
+        tier_counts[s.tier] = tier_counts.get(s.tier, 0) + 1
     print(f"  ✓ Tier distribution: {dict(sorted(tier_counts.items()))}")
     
     # Step F: Generate the brief
@@ -1,19 +1,114 @@
 """Heavyweight web scraper using Playwright for JavaScript-rendered pages."""
 
-from typing import TypedDict
+import asyncio
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
 
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import (
+    Browser,
+    Route,
+    async_playwright,
+    TimeoutError as PlaywrightTimeout,
+)
 
+# selectolax parses HTML in C; fall back to BeautifulSoup if it is missing
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None  # type: ignore[assignment, misc]
+    from bs4 import BeautifulSoup
 
-class ScrapeResult(TypedDict):
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Resource types that never contribute to the extracted text
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+# Elements removed before extracting text
+NON_CONTENT_TAGS = ("script", "style", "noscript", "header", "footer", "nav")
+
+# Matches any run of whitespace, for normalizing extracted text
+_WS_RE = re.compile(r"\s+")
+
+# Default cap on extracted text per page, in characters
+DEFAULT_MAX_TEXT_CHARS = 8000
+
+
+@dataclass(slots=True, frozen=True)
+class ScrapeResult:
     """Result of a scrape operation."""
     url: str
     text: str
     status: str
 
 
-async def scrape_url(url: str, timeout: int = 15) -> ScrapeResult:
+async def _block_heavy_resources(route: Route) -> None:
+    """Abort requests for resources that are discarded during text extraction."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _scrape_with_browser(
+    browser: Browser,
+    url: str,
+    timeout: int,
+    max_text_chars: int,
+) -> ScrapeResult:
+    """
+    Scrape a single URL in a fresh context of an already-running browser.
+    
+    Args:
+        browser: A launched Playwright browser.
+        url: The URL to scrape.
+        timeout: Timeout in seconds for page load.
+        max_text_chars: Maximum characters of text to keep.
+    
+    Returns:
+        A ScrapeResult with url, text, and status.
+    """
+    context = None
+    try:
+        context = await browser.new_context(user_agent=USER_AGENT)
+        await context.route("**/*", _block_heavy_resources)
+        page = await context.new_page()
+        
+        # Navigate and wait for the DOM to be ready
+        await page.goto(url, wait_until="domcontentloaded", timeout=timeout * 1000)
+        
+        # Extract body content
+        body_html = await page.content()
+        
+        # Clean the HTML
+        cleaned_text = _extract_clean_text(body_html, max_text_chars)
+        
+        return ScrapeResult(
+            url=url,
+            text=cleaned_text,
+            status="success",
+        )
+        
+    except PlaywrightTimeout:
+        return ScrapeResult(url=url, text="", status="error")
+    except Exception:
+        return ScrapeResult(url=url, text="", status="error")
+    finally:
+        if context:
+            await context.close()
+
+
+async def scrape_url(
+    url: str,
+    timeout: int = 15,
+    max_text_chars: int = DEFAULT_MAX_TEXT_CHARS,
+) -> ScrapeResult:
     """
     Scrape a URL using a headless browser.
     
@@ -23,76 +118,140 @@ async def scrape_url(url: str, timeout: int = 15) -> ScrapeResult:
     Args:
         url: The URL to scrape.
         timeout: Timeout in seconds for page load. Defaults to 15.
+        max_text_chars: Maximum characters of text to keep. Defaults to 8000.
     
     Returns:
-        A dictionary with 'url', 'text', and 'status' keys.
+        A ScrapeResult with url, text, and status.
         Status is 'success' on successful scrape, 'error' otherwise.
     """
-    async with async_playwright() as p:
-        browser = None
-        try:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
+    results = await scrape_urls(
+        [url],
+        concurrency=1,
+        timeout=timeout,
+        max_text_chars=max_text_chars,
+    )
+    return results[0]
+
+
+@asynccontextmanager
+async def open_scraper(
+    concurrency: int = 3,
+    timeout: int = 15,
+    max_text_chars: int = DEFAULT_MAX_TEXT_CHARS,
+) -> AsyncIterator[Callable[[str], Awaitable[ScrapeResult]]]:
+    """
+    Yield a function that scrapes a URL in a shared headless browser.
+    
+    The browser is launched on the first scrape, so no browser starts if
+    nothing is scraped, and is closed on exit. Each URL gets its own
+    browser context so cookies and storage stay isolated. Scrapes may be
+    started at any point while the context is open.
+    
+    Args:
+        concurrency: Max pages loading at the same time. Defaults to 3.
+        timeout: Timeout in seconds for each page load. Defaults to 15.
+        max_text_chars: Maximum characters of text to keep per page.
+                        Defaults to 8000.
+    
+    Yields:
+        An async function taking a URL and returning its ScrapeResult.
+    """
+    async with AsyncExitStack() as stack:
+        browser: Browser | None = None
+        launched = False
+        launch_lock = asyncio.Lock()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def get_browser() -> Browser | None:
+            nonlocal browser, launched
+            async with launch_lock:
+                if not launched:
+                    launched = True
+                    try:
+                        p = await stack.enter_async_context(async_playwright())
+                        browser = await p.chromium.launch(headless=True)
+                    except Exception:
+                        browser = None
+            return browser
+        
+        async def scrape(url: str) -> ScrapeResult:
+            async with semaphore:
+                shared_browser = await get_browser()
+                if shared_browser is None:
+                    return ScrapeResult(url=url, text="", status="error")
+                return await _scrape_with_browser(
+                    shared_browser, url, timeout, max_text_chars
                 )
-            )
-            page = await context.new_page()
-            
-            # Navigate and wait for network to settle
-            await page.goto(url, timeout=timeout * 1000)
-            await page.wait_for_load_state("networkidle", timeout=timeout * 1000)
-            
-            # Extract body content
-            body_html = await page.content()
-            
-            # Clean the HTML
-            cleaned_text = _extract_clean_text(body_html)
-            
-            await context.close()
-            
-            return ScrapeResult(
-                url=url,
-                text=cleaned_text,
-                status="success",
-            )
-            
-        except PlaywrightTimeout:
-            return ScrapeResult(url=url, text="", status="error")
-        except Exception:
-            return ScrapeResult(url=url, text="", status="error")
+        
+        try:
+            yield scrape
         finally:
             if browser:
                 await browser.close()
 
 
-def _extract_clean_text(html: str) -> str:
+async def scrape_urls(
+    urls: list[str],
+    concurrency: int = 3,
+    timeout: int = 15,
+    max_text_chars: int = DEFAULT_MAX_TEXT_CHARS,
+) -> list[ScrapeResult]:
     """
-    Extract clean text from HTML, removing scripts and styles.
+    Scrape multiple URLs using a single shared headless browser.
     
     Args:
-        html: Raw HTML content.
+        urls: The URLs to scrape.
+        concurrency: Max pages loading at the same time. Defaults to 3.
+        timeout: Timeout in seconds for each page load. Defaults to 15.
+        max_text_chars: Maximum characters of text to keep per page.
+                        Defaults to 8000.
     
     Returns:
-        Cleaned text content with normalized whitespace.
+        List of scrape results in the same order as urls.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    if not urls:
+        return []
     
-    # Remove script and style elements
-    for element in soup(["script", "style", "noscript", "header", "footer", "nav"]):
-        element.decompose()
+    async with open_scraper(concurrency, timeout, max_text_chars) as scrape:
+        results = await asyncio.gather(*(scrape(url) for url in urls))
+        return list(results)
+
+
+def _extract_clean_text(html: str, max_text_chars: int = DEFAULT_MAX_TEXT_CHARS) -> str:
+    """
+    Extract clean text from HTML, removing scripts and styles.
     
-    # Extract text
-    text = soup.get_text(separator=" ", strip=True)
+    Args:
+        html: Raw HTML content.
+        max_text_chars: Maximum characters of text to keep. Defaults to 8000.
     
-    # Normalize whitespace
-    lines = (line.strip() for line in text.splitlines())
-    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-    text = " ".join(chunk for chunk in chunks if chunk)
+    Returns:
+        Cleaned text content with normalized whitespace, truncated to
+        max_text_chars.
+    """
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        
+        # Remove script and style elements
+        for tag in NON_CONTENT_TAGS:
+            for node in tree.css(tag):
+                node.decompose()
+        
+        # Extract text
+        text = tree.body.text(separator=" ", strip=True) if tree.body else ""
+    else:
+        soup = BeautifulSoup(html, "html.parser")
+        
+        # Remove script and style elements
+        for element in soup(list(NON_CONTENT_TAGS)):
+            element.decompose()
+        
+        # Extract body text only, matching the selectolax path
+        text = soup.body.get_text(separator=" ", strip=True) if soup.body else ""
     
-    return text
+    # Normalize whitespace and cap the length
+    text = _WS_RE.sub(" ", text).strip()
+    return text[:max_text_chars]
 
 
 async def main() -> None:
@@ -102,10 +261,9 @@ async def main() -> None:
     
     result = await scrape_url(test_url, timeout=15)
     
-    print(f"Status: {result['status']}")
-    print(f"Text preview: {result['text'][:200]}...")
+    print(f"Status: {result.status}")
+    print(f"Text preview: {result.text[:200]}...")
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
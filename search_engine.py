@@ -5,7 +5,7 @@ from typing import TypedDict
 
 from asyncddgs import aDDGS
 
-from scraper import scrape_url, ScrapeResult
+from scraper import open_scraper, ScrapeResult
 
 
 class SearchResult(TypedDict):
@@ -15,10 +15,67 @@ class SearchResult(TypedDict):
     snippet: str
 
 
+# Shared DuckDuckGo session, opened lazily and reused across searches.
+# The session and its lock belong to the event loop that created them.
+_ddgs: aDDGS | None = None
+_ddgs_loop: asyncio.AbstractEventLoop | None = None
+_ddgs_lock: asyncio.Lock | None = None
+
+
+def _bind_ddgs_to_running_loop() -> asyncio.Lock:
+    """
+    Return the session lock for the running event loop.
+    
+    If the shared session was opened in an event loop that is no longer
+    running (e.g. a previous asyncio.run without close_ddgs), it can no
+    longer be used or closed, so it is dropped and a fresh one is opened
+    on next use.
+    """
+    global _ddgs, _ddgs_loop, _ddgs_lock
+    
+    loop = asyncio.get_running_loop()
+    if _ddgs_loop is not loop or _ddgs_lock is None:
+        _ddgs = None
+        _ddgs_loop = loop
+        _ddgs_lock = asyncio.Lock()
+    return _ddgs_lock
+
+
+async def _get_ddgs() -> aDDGS:
+    """
+    Return the shared DuckDuckGo session, opening it on first use.
+    
+    The library's built-in rate limiter is disabled: it would sleep
+    between requests on a shared session, which per-query sessions
+    never did.
+    """
+    global _ddgs
+    
+    async with _bind_ddgs_to_running_loop():
+        if _ddgs is None:
+            ddgs = aDDGS(enable_rate_limit=False)
+            await ddgs.__aenter__()
+            _ddgs = ddgs
+        return _ddgs
+
+
+async def close_ddgs() -> None:
+    """Close the shared DuckDuckGo session if one is open."""
+    global _ddgs
+    
+    async with _bind_ddgs_to_running_loop():
+        if _ddgs is not None:
+            ddgs, _ddgs = _ddgs, None
+            await ddgs.__aexit__(None, None, None)
+
+
 async def perform_search(query: str, max_results: int = 5) -> list[SearchResult]:
     """
     Perform an async search using DuckDuckGo.
     
+    Searches share one session; call close_ddgs() once all searches
+    are done.
+    
     Args:
         query: The search query string.
         max_results: Maximum number of results to return. Defaults to 5.
@@ -27,21 +84,40 @@ async def perform_search(query: str, max_results: int = 5) -> list[SearchResult]
         List of search results with title, url, and snippet.
     """
     try:
-        async with aDDGS() as ddgs:
-            results = await ddgs.text(query, max_results=max_results)
-            
-            return [
-                SearchResult(
-                    title=r.get("title", ""),
-                    url=r.get("href", ""),
-                    snippet=r.get("body", ""),
-                )
-                for r in results
-            ]
+        ddgs = await _get_ddgs()
+        results = await ddgs.text(query, max_results=max_results)
+        
+        return [
+            SearchResult(
+                title=r.get("title", ""),
+                url=r.get("href", ""),
+                snippet=r.get("body", ""),
+            )
+            for r in results
+        ]
     except Exception:
         return []
 
 
+def _dedupe_queries(queries: list[str]) -> list[str]:
+    """
+    Drop blank and duplicate queries, preserving first-seen order.
+    
+    Queries are compared case-insensitively after stripping whitespace.
+    """
+    seen: set[str] = set()
+    unique: list[str] = []
+    
+    for query in queries:
+        query = query.strip()
+        key = query.lower()
+        if query and key not in seen:
+            seen.add(key)
+            unique.append(query)
+    
+    return unique
+
+
 async def gather_data(
     queries: list[str],
     max_results_per_query: int = 5,
@@ -56,42 +132,45 @@ async def gather_data(
         queries: List of search queries to execute.
         max_results_per_query: Max results per search query. Defaults to 5.
         max_urls: Maximum unique URLs to scrape. Defaults to 10.
-        scrape_concurrency: Max concurrent browser instances. Defaults to 3.
+        scrape_concurrency: Max concurrent page loads. Defaults to 3.
         scrape_timeout: Timeout for each scrape in seconds. Defaults to 15.
     
     Returns:
-        List of scraped data dictionaries with url, text, and status.
+        List of ScrapeResult objects with url, text, and status.
     """
-    # Run all searches concurrently
+    # Run all unique searches concurrently
     search_tasks = [
-        perform_search(query, max_results=max_results_per_query)
-        for query in queries
+        asyncio.create_task(perform_search(query, max_results=max_results_per_query))
+        for query in _dedupe_queries(queries)
     ]
-    all_results = await asyncio.gather(*search_tasks)
     
-    # Flatten and deduplicate URLs (preserve order)
-    seen_urls: set[str] = set()
-    unique_urls: list[str] = []
-    
-    for results in all_results:
-        for result in results:
-            url = result["url"]
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique_urls.append(url)
-    
-    # Limit to max_urls
-    urls_to_scrape = unique_urls[:max_urls]
-    
-    # Scrape with limited concurrency
-    semaphore = asyncio.Semaphore(scrape_concurrency)
-    
-    async def scrape_with_limit(url: str) -> ScrapeResult:
-        async with semaphore:
-            return await scrape_url(url, timeout=scrape_timeout)
-    
-    scrape_tasks = [scrape_with_limit(url) for url in urls_to_scrape]
-    scraped_data = await asyncio.gather(*scrape_tasks)
+    # Start scraping each unique URL as soon as its search finishes,
+    # stopping at max_urls (dict keys keep first-seen order)
+    seen_urls: dict[str, None] = {}
+    scrape_tasks: list[asyncio.Task[ScrapeResult]] = []
+    
+    async with open_scraper(
+        concurrency=scrape_concurrency,
+        timeout=scrape_timeout,
+    ) as scrape:
+        try:
+            for next_search in asyncio.as_completed(search_tasks):
+                for result in await next_search:
+                    if len(seen_urls) >= max_urls:
+                        break
+                    url = result["url"]
+                    if url and url not in seen_urls:
+                        seen_urls[url] = None
+                        scrape_tasks.append(asyncio.create_task(scrape(url)))
+                if len(seen_urls) >= max_urls:
+                    break
+            
+            scraped_data = await asyncio.gather(*scrape_tasks)
+        finally:
+            # Cancel searches that are no longer needed, and any scrapes
+            # still running if we are bailing out, before the browser closes
+            for task in (*search_tasks, *scrape_tasks):
+                task.cancel()
     
     return list(scraped_data)
 
@@ -123,10 +202,12 @@ async def main() -> None:
     
     print(f"Scraped {len(scraped)} pages:")
     for s in scraped:
-        status = "✓" if s["status"] == "success" else "✗"
-        text_preview = s["text"][:80] + "..." if s["text"] else "(no content)"
-        print(f"  {status} {s['url'][:50]}...")
+        status = "✓" if s.status == "success" else "✗"
+        text_preview = s.text[:80] + "..." if s.text else "(no content)"
+        print(f"  {status} {s.url[:50]}...")
         print(f"    {text_preview}")
+    
+    await close_ddgs()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,43 @@
+"""Tests for HTML text extraction in the scraper module."""
+
+import bs4
+import pytest
+
+import scraper
+from scraper import _extract_clean_text
+
+
+HTML = """<html>
+<head><title>T</title><style>p { color: red; }</style></head>
+<body>
+  <nav>Menu</nav>
+  <header>Site header</header>
+  <p>Hello
+     world</p>
+  <script>var x = 1;</script>
+  <noscript>Enable JS</noscript>
+  <div>Second   paragraph</div>
+  <footer>Footer</footer>
+</body>
+</html>"""
+
+
+def test_fast_parser_is_available() -> None:
+    """The selectolax parser imports, so the BeautifulSoup fallback is not used."""
+    assert scraper.LexborHTMLParser is not None
+
+
+def test_extract_clean_text() -> None:
+    assert _extract_clean_text(HTML) == "Hello world Second paragraph"
+
+
+def test_extract_clean_text_truncates() -> None:
+    assert _extract_clean_text(HTML, max_text_chars=8) == "Hello wo"
+
+
+def test_beautifulsoup_fallback_matches(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The fallback path extracts the same body-only text."""
+    monkeypatch.setattr(scraper, "LexborHTMLParser", None)
+    monkeypatch.setattr(scraper, "BeautifulSoup", bs4.BeautifulSoup, raising=False)
+
+    assert _extract_clean_text(HTML) == "Hello world Second paragraph"
@@ -0,0 +1,73 @@
+"""Tests for prompt source formatting and saving in the writer module."""
+
+from pathlib import Path
+
+import pytest
+
+from writer import SourceInfo, _format_sources_for_prompt, save_brief
+
+
+def _source(n: int, tier: int, length: int) -> SourceInfo:
+    return SourceInfo(
+        url=f"https://example{n}.com/page",
+        domain=f"example{n}.com",
+        text="z" * length,
+        tier=tier,
+        status="success",
+    )
+
+
+def test_leftover_budget_tops_up_high_tier_sources() -> None:
+    """Chars unused by short low-tier sources go to truncated Tier 1 sources."""
+    sources = [_source(i, 4, 50) for i in range(20)]
+    sources += [_source(100 + i, 1, 8000) for i in range(3)]
+
+    formatted, count = _format_sources_for_prompt(sources, total_budget=30_000)
+
+    assert count == 23
+    assert "[truncated]" not in formatted
+    assert formatted.count("z") == 3 * 8000 + 20 * 50
+    # Best tier first
+    assert formatted.startswith("[1] Source (Tier 1)")
+
+
+def test_total_budget_is_respected() -> None:
+    """Source text never exceeds the total budget and excess sources are dropped."""
+    sources = [_source(i, 1 + i % 5, 20_000) for i in range(100)]
+
+    formatted, count = _format_sources_for_prompt(
+        sources, total_budget=30_000, min_chars=500
+    )
+
+    assert count == 60
+    assert formatted.count("z") == 30_000
+
+
+def test_no_sources() -> None:
+    assert _format_sources_for_prompt([]) == ("No sources were successfully scraped.", 0)
+
+
+def test_save_brief_creates_directory(tmp_path: Path) -> None:
+    output_dir = tmp_path / "reports"
+
+    saved = Path(save_brief("# Brief", "Will X happen?", output_dir=str(output_dir)))
+
+    assert saved.parent == output_dir
+    assert saved.read_text(encoding="utf-8") == "# Brief"
+    assert list(output_dir.iterdir()) == [saved]
+
+
+def test_save_brief_removes_temp_file_on_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failed write leaves neither the brief nor its temporary file behind."""
+    def fail_write(self: Path, *args: object, **kwargs: object) -> int:
+        self.touch()
+        raise OSError("disk full")
+
+    monkeypatch.setattr(Path, "write_text", fail_write)
+
+    with pytest.raises(OSError):
+        save_brief("# Brief", "Will X happen?", output_dir=str(tmp_path))
+
+    assert list(tmp_path.iterdir()) == []
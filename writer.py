@@ -1,18 +1,29 @@
 """Brief writer module for generating the final forecast report."""
 
+import asyncio
+import functools
+import io
+import os
+import re
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TypedDict
+from pathlib import Path
 from urllib.parse import urlparse
 
-from config import Config, load_config
+from config import load_config
 from llm_client import LLMClient, LLMClientError
 from scraper import ScrapeResult
 
 
-class SourceInfo(TypedDict):
+# Characters stripped from the question when building a filename
+_SAFE_RE = re.compile(r"[^a-zA-Z0-9\s]")
+
+
+@dataclass(slots=True, frozen=True)
+class SourceInfo:
     """Source information with tier classification."""
     url: str
+    domain: str
     text: str
     tier: int
     status: str
@@ -27,6 +38,7 @@ class PlanInfo:
     historical_queries: list[str]
 
 
+@functools.lru_cache(maxsize=1024)
 def _extract_domain(url: str) -> str:
     """Extract domain from URL for display."""
     parsed = urlparse(url)
@@ -36,38 +48,118 @@ def _extract_domain(url: str) -> str:
     return domain
 
 
-def _format_sources_for_prompt(sources: list[SourceInfo], max_chars: int = 2000) -> str:
+def build_source_info(scrape: ScrapeResult, tier: int) -> SourceInfo:
+    """
+    Combine a scrape result with its tier into a SourceInfo.
+    
+    The display domain is computed once here so formatting the prompt
+    does not have to re-parse every URL.
+    """
+    return SourceInfo(
+        url=scrape.url,
+        domain=_extract_domain(scrape.url),
+        text=scrape.text,
+        tier=tier,
+        status=scrape.status,
+    )
+
+
+def _allocate_source_budget(
+    sources: list[SourceInfo],
+    total_budget: int,
+    min_chars: int,
+) -> list[int]:
+    """
+    Split a character budget across sources already ordered best tier first.
+    
+    First each source gets min(len(text), share), where share is an equal
+    split of the budget (at least min_chars); sources are dropped once
+    less than min_chars of budget remains. The budget left over is then
+    shared out among the truncated Tier 1-2 sources.
+    
+    Returns:
+        Characters allotted to each included source, in order. Sources past
+        the end of the list are not included.
+    """
+    share = max(min_chars, total_budget // len(sources))
+    remaining = total_budget
+    allocations: list[int] = []
+    
+    for source in sources:
+        if remaining < min_chars:
+            break
+        allotted = min(len(source.text), share, remaining)
+        allocations.append(allotted)
+        remaining -= allotted
+    
+    # Top up truncated Tier 1-2 sources from what the others left unused
+    needy = [
+        i for i, allotted in enumerate(allocations)
+        if sources[i].tier <= 2 and len(sources[i].text) > allotted
+    ]
+    while remaining > 0 and needy:
+        portion = max(1, remaining // len(needy))
+        still_needy: list[int] = []
+        for i in needy:
+            extra = min(portion, len(sources[i].text) - allocations[i], remaining)
+            allocations[i] += extra
+            remaining -= extra
+            if len(sources[i].text) > allocations[i]:
+                still_needy.append(i)
+        needy = still_needy
+    
+    return allocations
+
+
+def _format_sources_for_prompt(
+    sources: list[SourceInfo],
+    total_budget: int = 30_000,
+    min_chars: int = 500,
+) -> tuple[str, int]:
     """
     Format scraped sources for inclusion in the LLM prompt.
     
+    Sources are ordered best tier first and share a global character
+    budget. Each source gets an equal share (at least min_chars); chars
+    left unused by short sources are then given to truncated Tier 1-2
+    sources. Sources are dropped once the budget is exhausted.
+    
     Args:
-        sources: List of source info dictionaries with tier data.
-        max_chars: Maximum characters to include per source. Defaults to 2000.
+        sources: List of sources with tier data.
+        total_budget: Maximum source text characters across all sources.
+                      Defaults to 30000.
+        min_chars: Smallest share given to, or worth adding for, a source.
+                   Defaults to 500.
     
     Returns:
-        Formatted string of all sources.
+        The formatted string and the number of sources it includes.
     """
     if not sources:
-        return "No sources were successfully scraped."
+        return "No sources were successfully scraped.", 0
+    
+    ordered = sorted(sources, key=lambda s: s.tier)
+    allocations = _allocate_source_budget(ordered, total_budget, min_chars)
     
-    formatted_parts: list[str] = []
+    buf = io.StringIO()
     
-    for i, source in enumerate(sources, 1):
-        domain = _extract_domain(source["url"])
-        tier = source["tier"]
-        text = source["text"]
+    for i, (source, allotted) in enumerate(zip(ordered, allocations), 1):
+        if i > 1:
+            buf.write("\n---\n")
         
-        # Truncate text if needed
-        if len(text) > max_chars:
-            text = text[:max_chars] + "... [truncated]"
+        buf.write(f"[{i}] Source (Tier {source.tier}): {source.url}\n")
+        buf.write(f"Domain: {source.domain}\n")
+        buf.write("Content:\n")
         
-        formatted_parts.append(
-            f"[{i}] Source (Tier {tier}): {source['url']}\n"
-            f"Domain: {domain}\n"
-            f"Content:\n{text}\n"
-        )
+        # Truncate text if needed
+        text = source.text
+        if len(text) > allotted:
+            buf.write(text[:allotted])
+            buf.write("... [truncated]")
+        else:
+            buf.write(text)
+        buf.write("\n")
     
-    return "\n---\n".join(formatted_parts)
+    return buf.getvalue(), len(allocations)
 
 
 def _build_system_prompt(
@@ -190,10 +282,10 @@ async def write_brief(
         LLMClientError: If the LLM call fails.
     """
     # Filter to only successful scrapes
-    valid_sources = [s for s in scraped_data if s["status"] == "success" and s["text"]]
+    valid_sources = [s for s in scraped_data if s.status == "success" and s.text]
     
     # Format sources for the prompt
-    formatted_sources = _format_sources_for_prompt(valid_sources)
+    formatted_sources, source_count = _format_sources_for_prompt(valid_sources)
     
     # Build the comprehensive prompt
     system_prompt = _build_system_prompt(
@@ -201,7 +293,7 @@ async def write_brief(
         plan_info=plan_info,
         base_rate_summary=base_rate_summary,
         formatted_sources=formatted_sources,
-        source_count=len(valid_sources),
+        source_count=source_count,
     )
     
     messages = [
@@ -210,8 +302,10 @@ async def write_brief(
     ]
     
     try:
-        response = await client.generate_response(messages, temperature=temperature)
-        return response.strip()
+        chunks: list[str] = []
+        async for chunk in client.stream_response(messages, temperature=temperature):
+            chunks.append(chunk)
+        return "".join(chunks).strip()
     except LLMClientError as e:
         # Return an error brief if generation fails
         return f"""# Forecast Brief: {question}
@@ -233,33 +327,39 @@ def save_brief(brief: str, question: str, output_dir: str = "./reports") -> str:
     Args:
         brief: The generated Markdown content.
         question: The original question (used for filename).
-        output_dir: Directory to save the file. Defaults to current directory.
+        output_dir: Directory to save the file, created if missing.
+                    Defaults to ./reports.
     
     Returns:
         The path to the saved file.
     """
-    from pathlib import Path
-    import re
-    
     # Create filename from date and question snippet
     date_str = datetime.now().strftime("%Y-%m-%d")
     
     # Clean question for filename (first 50 chars, alphanumeric only)
-    clean_question = re.sub(r"[^a-zA-Z0-9\s]", "", question)
+    clean_question = _SAFE_RE.sub("", question)
     clean_question = "_".join(clean_question.split()[:6])
     
     filename = f"{date_str}_{clean_question}.md"
     
     output_path = Path(output_dir) / filename
-    output_path.write_text(brief, encoding="utf-8")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Write to a temporary file and rename so a partial brief is never left behind
+    # (the PID keeps concurrent runs from sharing a temporary file)
+    tmp_path = output_path.with_name(f".{output_path.stem}.{os.getpid()}.md.tmp")
+    try:
+        tmp_path.write_text(brief, encoding="utf-8")
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     
     return str(output_path)
 
 
 async def main() -> None:
     """Test the brief writer."""
-    from forecasting_logic import SearchPlan
-    
     config = load_config()
     client = LLMClient(config)
     
@@ -267,22 +367,24 @@ async def main() -> None:
     question = "Will the Federal Reserve cut interest rates in Q1 2026?"
     
     mock_sources: list[SourceInfo] = [
-        {
-            "url": "https://reuters.com/markets/fed-policy-outlook",
-            "text": "The Federal Reserve signaled a cautious approach to rate cuts in 2026, "
-                    "with Chair Powell noting inflation remains above target. Markets expect "
-                    "two rate cuts by mid-2026, with the first potentially in March.",
-            "tier": 2,
-            "status": "success",
-        },
-        {
-            "url": "https://bloomberg.com/fed-watch",
-            "text": "Fed officials remain divided on the pace of rate cuts. The December "
-                    "minutes showed some members favoring a pause while others pushed for "
-                    "gradual easing. Economic data will be key for Q1 decisions.",
-            "tier": 2,
-            "status": "success",
-        },
+        SourceInfo(
+            url="https://reuters.com/markets/fed-policy-outlook",
+            domain="reuters.com",
+            text="The Federal Reserve signaled a cautious approach to rate cuts in 2026, "
+                 "with Chair Powell noting inflation remains above target. Markets expect "
+                 "two rate cuts by mid-2026, with the first potentially in March.",
+            tier=2,
+            status="success",
+        ),
+        SourceInfo(
+            url="https://bloomberg.com/fed-watch",
+            domain="bloomberg.com",
+            text="Fed officials remain divided on the pace of rate cuts. The December "
+                 "minutes showed some members favoring a pause while others pushed for "
+                 "gradual easing. Economic data will be key for Q1 decisions.",
+            tier=2,
+            status="success",
+        ),
     ]
     
     plan_info = PlanInfo(
@@ -317,5 +419,4 @@ Caveat: Current labor market conditions differ from historical norms."""
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())